@@ -6,34 +6,180 @@ using a Spotify or SoundCloud link.
 Usage examples:
     python3 genfinder.py -sp <URL> -l
     python3 genfinder.py -sc <URL> -d -o json -f /chemin/vers/dossier
+    cat urls.txt | python3 genfinder.py -sp - -l -f ./lyrics
 
 Options:
     -sp, --spotify    Spotify track URL (mutually exclusive with -sc)
     -sc, --soundcloud SoundCloud track URL (mutually exclusive with -sp)
+                      Pass "-" to read newline-delimited URLs from stdin.
     -l, --lyrics      Return only the lyrics
     -d, --data        Return only the song metadata
     -o, --output      Output format: "text" (default) or "json"
     -f, --file        Save output to file in specified folder (optional argument).
                       If no folder is given, save to current directory.
+    --no-cache        Bypass the on-disk cache (~/.cache/genfinder).
 """
 
 import argparse
-import json
+import asyncio
+import contextlib
+import functools
+import hashlib
 import os
+import random
 import re
+import sqlite3
 import sys
-from typing import Tuple, Optional
+import time
+import unicodedata
+from typing import Any, Callable, List, Tuple, Optional, Union
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
+from lxml import etree
+
+try:
+    import brotli  # Lets aiohttp decode brotli-compressed responses
+except ImportError:
+    brotli = None
 
 GENIUS_API_BASE = "https://api.genius.com"
+GENIUS_WEB_BASE = "https://genius.com"
 GENIUS_ACCESS_TOKEN = (
     "[/!\ YOUR GENIUS ACCESS TOKEN HERE /!\]" #MAKE SURE TO PUT YOUR GENIUS ACCESS API TOKEN HERE !!!
 )
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_CONCURRENT_TRACKS = 64
+GENIUS_SEARCH_PER_PAGE = 3
+# Default Genius API budget (requests per period, in seconds), refined from
+# X-RateLimit-* response headers when the API sends them.
+GENIUS_RATE_LIMIT = 300
+GENIUS_RATE_PERIOD = 60
+GENIUS_MAX_ATTEMPTS = 5
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "genfinder", "cache.sqlite3")
+CACHE_TTL = 86400
+# Lyric page validators are kept longer than CACHE_TTL so expired lyrics can be
+# revalidated; no entry outlives this age.
+CACHE_MAX_AGE = 30 * 86400
+MEMO_MAX_SIZE = 4096
+# Lyric pages are large HTML documents: ask for brotli whenever it can be decoded.
+LYRICS_ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+LYRICS_CHUNK_SIZE = 16 * 1024
+
+_FILENAME_RE = re.compile(r'[^\w\s\-_().]')
+
+_MISSING = object()
+
+
+class _Cache:
+    """
+    Minimal persistent key/value store backed by SQLite.
+    Values are stored as JSON along with the time they were written;
+    entries older than max_age seconds are dropped when the store is opened.
+    """
+
+    def __init__(self, path: str, max_age: float = CACHE_MAX_AGE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.execute("DELETE FROM cache WHERE stored_at < ?", (time.time() - max_age,))
+        self._conn.commit()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Any:
+        """Return the stored value, or _MISSING if absent or older than ttl seconds."""
+        row = self._conn.execute("SELECT value, stored_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or (ttl is not None and time.time() - row[1] > ttl):
+            return _MISSING
+        return orjson.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+            (key, orjson.dumps(value), time.time()),
+        )
+        self._conn.commit()
+
+
+_cache: Optional[_Cache] = None
 
-def _get_spotify_metadata(url: str) -> Tuple[str, str]:
+
+def _cached(ttl: float, key: Optional[Callable[..., tuple]] = None, memoize: bool = False):
+    """
+    Cache the result of a network helper in the on-disk cache.
+    The key is built from the function name and every argument after the
+    session, or from key(*args) when given; None results are never stored.
+    With memoize, identical calls made during the same run share a single
+    lookup, even while the first one is still in flight. Finished lookups
+    leave the memo once the disk cache holds their result; without a disk
+    cache the memo keeps at most MEMO_MAX_SIZE of them.
+    The wrapper's is_cached(*args) tells whether a call would be answered
+    from the on-disk cache.
+    """
+    def decorator(func):
+        memo = {}
+
+        def make_key(args: tuple) -> str:
+            key_args = key(*args) if key is not None else args
+            return hashlib.sha256(orjson.dumps([func.__name__, *key_args])).hexdigest()
+
+        async def lookup(session: aiohttp.ClientSession, args: tuple, cache_key: str):
+            if _cache is None:
+                return await func(session, *args)
+            value = _cache.get(cache_key, ttl)
+            if value is _MISSING:
+                value = await func(session, *args)
+                if value is not None:
+                    _cache.set(cache_key, value)
+            return value
+
+        @functools.wraps(func)
+        async def wrapper(session: aiohttp.ClientSession, *args):
+            cache_key = make_key(args)
+            if not memoize:
+                return await lookup(session, args, cache_key)
+
+            task = memo.get(cache_key)
+            if task is None:
+                if len(memo) >= MEMO_MAX_SIZE:
+                    del memo[next(iter(memo))]
+                task = memo[cache_key] = asyncio.ensure_future(lookup(session, args, cache_key))
+                task.add_done_callback(functools.partial(forget, cache_key))
+            return await asyncio.shield(task)
+
+        def forget(cache_key: str, task: asyncio.Future) -> None:
+            # Failures are dropped so a later call retries instead of replaying them.
+            failed = task.cancelled() or task.exception() is not None
+            if (failed or _cache is not None) and memo.get(cache_key) is task:
+                del memo[cache_key]
+
+        def is_cached(*args) -> bool:
+            return _cache is not None and _cache.get(make_key(args), ttl) is not _MISSING
+
+        wrapper.is_cached = is_cached
+        return wrapper
+    return decorator
+
+
+def _normalize_text(text: str) -> str:
+    """Casefold text, strip its diacritics and collapse its whitespace."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.casefold().split())
+
+
+def _normalize_query(track: str, artist: str) -> Tuple[str, str]:
+    """
+    Normalize a track/artist pair so that variants differing only by case,
+    whitespace or diacritics share the same search cache entry.
+    """
+    return _normalize_text(track), _normalize_text(artist)
+
+
+@_cached(ttl=CACHE_TTL)
+async def _get_spotify_metadata(session: aiohttp.ClientSession, url: str) -> Tuple[str, str]:
     """
     Retrieve track and artist information from a Spotify track URL
     using Spotify's public oEmbed endpoint.
@@ -42,23 +188,25 @@ def _get_spotify_metadata(url: str) -> Tuple[str, str]:
         ValueError: If metadata cannot be extracted or the URL is invalid.
     """
     try:
-        response = requests.get(f"https://open.spotify.com/oembed?url={url}", timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        async with session.get(f"https://open.spotify.com/oembed?url={url}") as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
         title = data.get("title")
         if not title:
             raise ValueError("Invalid Spotify metadata: title not found.")
 
-        parts = [p.strip() for p in title.split(" - ")]
-        if len(parts) >= 2:
-            return parts[0], parts[-1]
+        # "<track> - ... - <artist>": only the first and last segments are needed
+        head, sep, tail = title.partition(" - ")
+        if sep:
+            return head.strip(), tail.rpartition(" - ")[2].strip()
         return title, ""
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         raise ValueError(f"Invalid or unreachable Spotify URL: {e}")
-    except (KeyError, json.JSONDecodeError) as e:
+    except (KeyError, orjson.JSONDecodeError) as e:
         raise ValueError(f"Malformed Spotify response: {e}")
 
-def _get_soundcloud_metadata(url: str) -> Tuple[str, str]:
+@_cached(ttl=CACHE_TTL)
+async def _get_soundcloud_metadata(session: aiohttp.ClientSession, url: str) -> Tuple[str, str]:
     """
     Retrieve track and artist information from a SoundCloud track URL
     using SoundCloud's public oEmbed endpoint.
@@ -67,66 +215,215 @@ def _get_soundcloud_metadata(url: str) -> Tuple[str, str]:
         ValueError: If metadata cannot be extracted or the URL is invalid.
     """
     try:
-        response = requests.get(f"https://soundcloud.com/oembed?format=json&url={url}", timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        async with session.get(f"https://soundcloud.com/oembed?format=json&url={url}") as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
         title = data.get("title")
         if not title:
             raise ValueError("Invalid SoundCloud metadata: title not found.")
 
-        parts = [p.strip() for p in title.split(" - ")]
-        if len(parts) >= 2:
-            return " - ".join(parts[1:]), parts[0]
+        # "<artist> - <track>", where the track itself may contain " - "
+        head, sep, tail = title.partition(" - ")
+        if sep:
+            return tail.strip(), head.strip()
         return title, ""
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         raise ValueError(f"Invalid or unreachable SoundCloud URL: {e}")
-    except (KeyError, json.JSONDecodeError) as e:
+    except (KeyError, orjson.JSONDecodeError) as e:
         raise ValueError(f"Malformed SoundCloud response: {e}")
 
-def _search_genius(track: str, artist: str, token: str) -> Optional[int]:
-    headers = {"Authorization": f"Bearer {token}"}
+class _RateLimiter:
+    """
+    Token bucket allowing at most max_rate requests per period seconds,
+    shared by every concurrent caller.
+    """
+
+    def __init__(self, max_rate: float, period: float):
+        self._max_rate = max_rate
+        self._period = period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self._max_rate / self._period
+                self._tokens = min(self._max_rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._period / self._max_rate)
+
+    def update(self, headers) -> None:
+        """Follow the X-RateLimit-Limit / X-RateLimit-Remaining headers of a response."""
+        try:
+            if "X-RateLimit-Limit" in headers:
+                self._max_rate = max(1.0, float(headers["X-RateLimit-Limit"]))
+            if "X-RateLimit-Remaining" in headers:
+                self._tokens = min(self._tokens, float(headers["X-RateLimit-Remaining"]))
+        except ValueError:
+            pass
+
+
+_genius_limiter = _RateLimiter(GENIUS_RATE_LIMIT, GENIUS_RATE_PERIOD)
+
+
+async def _genius_get(api: aiohttp.ClientSession, path: str, **kwargs) -> dict:
+    """
+    GET a Genius API endpoint through the shared rate limiter and return the
+    'response' part of its payload. Rate-limited (429) and server errors
+    (5xx) are retried with exponential backoff, honouring Retry-After.
+
+    Raises:
+        aiohttp.ClientResponseError: If the request still fails after
+            GENIUS_MAX_ATTEMPTS attempts, or fails with another HTTP error.
+    """
+    for attempt in range(GENIUS_MAX_ATTEMPTS):
+        await _genius_limiter.acquire()
+        async with api.get(path, **kwargs) as response:
+            _genius_limiter.update(response.headers)
+            retryable = response.status == 429 or response.status >= 500
+            if not retryable or attempt == GENIUS_MAX_ATTEMPTS - 1:
+                try:
+                    response.raise_for_status()
+                except aiohttp.ClientResponseError as e:
+                    if e.status == 401:
+                        sys.stderr.write("[ERROR] Invalid Genius API access token (HTTP 401 Unauthorized).\n")
+                        sys.exit(1)
+                    else:
+                        raise e
+                return orjson.loads(await response.read())["response"]
+            retry_after = response.headers.get("Retry-After", "")
+
+        delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+        await asyncio.sleep(delay)
+
+
+@_cached(ttl=CACHE_TTL, key=_normalize_query, memoize=True)
+async def _search_genius(api: aiohttp.ClientSession, track: str, artist: str) -> Optional[dict]:
+    """
+    Search Genius for the song and return the best matching search result.
+    The result carries both the song id and the page URL, so the lyrics can be
+    scraped without waiting on the songs endpoint.
+
+    The search and the artist match only use the normalized track/artist
+    pair, so every spelling sharing a cache key gets the same result.
+    """
+    track, artist = _normalize_query(track, artist)
     query = f"{track} {artist}".strip()
-    response = requests.get(f"{GENIUS_API_BASE}/search", headers=headers, params={"q": query}, timeout=10)
-    try:
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
-            sys.stderr.write(f"[ERROR] Invalid Genius API access token: {e}")
-            sys.exit(1)
-        else:
-            raise e
-    hits = response.json()["response"]["hits"]
-    artist_lower = artist.lower()
+    hits = (await _genius_get(api, "/search", params={"q": query, "per_page": GENIUS_SEARCH_PER_PAGE}))["hits"]
 
-    for hit in hits:
-        primary_artist = hit["result"]["primary_artist"]["name"].lower()
-        if artist_lower and artist_lower in primary_artist:
-            return hit["result"]["id"]
+    # An empty artist matches the first hit, which is also the fallback.
+    return next(
+        (hit["result"] for hit in hits if artist in _normalize_text(hit["result"]["primary_artist"]["name"])),
+        hits[0]["result"] if hits else None,
+    )
 
-    if hits:
-        return hits[0]["result"]["id"]
-    return None
 
+@_cached(ttl=CACHE_TTL)
+async def _get_genius_song(api: aiohttp.ClientSession, song_id: int) -> dict:
+    return (await _genius_get(api, f"/songs/{song_id}"))["song"]
 
-def _get_genius_song(song_id: int, token: str) -> dict:
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(f"{GENIUS_API_BASE}/songs/{song_id}", headers=headers, timeout=10)
-    try:
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
-            sys.stderr.write("[ERROR] Invalid Genius API access token (HTTP 401 Unauthorized).\n")
-            sys.exit(1)
-        else:
-            raise e
-    return response.json()["response"]["song"]
+
+_NON_TEXT_TAGS = frozenset(("script", "style", "template"))
 
 
-def _scrape_genius_lyrics(url: str) -> str:
+class _LyricsCollector:
+    """
+    lxml parser target extracting the lyrics from a Genius song page while
+    it is being parsed, without ever building the document tree.
+
+    Text is only collected inside divs marked 'data-lyrics-container', and
+    subtrees marked 'data-exclude-from-selection' (ads, annotations, ...)
+    are skipped, as are script, style and template contents. Text nodes,
+    which tags and comments delimit, are separated by newlines, so each
+    <br> of the lyrics starts a new line.
+
+    The text nodes of every container go into a single list joined once at
+    the end; only the nodes at the edges of each container are trimmed.
+    """
+
+    def __init__(self):
+        self._depth = 0         # Nesting depth inside the current lyrics container
+        self._skip_depth = 0    # Nesting depth inside an excluded subtree
+        self._text = []         # Pieces of the text node being read
+        self._strings = []      # Text nodes of every container read so far
+        self._container_start = 0
+
+    def _flush_text(self):
+        if self._text:
+            text = "".join(self._text)
+            if text.isspace():
+                # Whitespace between tags collapses to a single character.
+                text = "\n" if "\n" in text else " "
+            self._strings.append(text)
+            self._text = []
+
+    def start(self, tag, attrib):
+        if self._depth:
+            self._flush_text()
+            self._depth += 1
+            if self._skip_depth:
+                self._skip_depth += 1
+            elif tag in _NON_TEXT_TAGS or "data-exclude-from-selection" in attrib:
+                self._skip_depth = 1
+        elif tag == "div" and attrib.get("data-lyrics-container") == "true":
+            self._depth = 1
+            self._container_start = len(self._strings)
+
+    def end(self, tag):
+        if not self._depth:
+            return
+        self._flush_text()
+        self._depth -= 1
+        if self._skip_depth:
+            self._skip_depth -= 1
+        if not self._depth:
+            self._trim_container()
+
+    def _trim_container(self):
+        """Strip the container's text as a whole, dropping it if only whitespace remains."""
+        strings = self._strings
+        start = self._container_start
+        end = len(strings)
+        while end > start and strings[end - 1].isspace():
+            end -= 1
+        first = start
+        while first < end and strings[first].isspace():
+            first += 1
+        del strings[end:]
+        del strings[start:first]
+        if len(strings) > start:
+            strings[start] = strings[start].lstrip()
+            strings[-1] = strings[-1].rstrip()
+
+    def data(self, data):
+        if self._depth and not self._skip_depth:
+            self._text.append(data)
+
+    def comment(self, text):
+        # Comments are not collected, but they still end the current text node.
+        if self._depth:
+            self._flush_text()
+
+    def close(self) -> str:
+        return "\n".join(self._strings)
+
+
+@_cached(ttl=CACHE_TTL)
+async def _scrape_genius_lyrics(session: aiohttp.ClientSession, url: str) -> str:
     """
     Scrape the lyrics from the Genius song webpage.
-    Excludes elements marked with 'data-exclude-from-selection' to avoid
-    unwanted content like ads or annotations.
+    The HTML is streamed into an incremental lxml parser, so the full page
+    is never held in memory. When the page was seen before, the request is
+    made conditional on its ETag / Last-Modified validators and a 304 reuses
+    the stored lyrics without downloading or parsing the HTML again.
 
     Args:
         url (str): URL of the Genius song page.
@@ -134,22 +431,35 @@ def _scrape_genius_lyrics(url: str) -> str:
     Returns:
         str: Cleaned lyrics text.
     """
-    response = requests.get(url, timeout=10)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    lyrics_containers = soup.find_all("div", {"data-lyrics-container": "true"})
-    lyrics_lines = []
-
-    for container in lyrics_containers:
-        for excluded in container.find_all(attrs={"data-exclude-from-selection": True}):
-            excluded.extract()
-
-        text = container.get_text(separator="\n").strip()
-        if text:
-            lyrics_lines.append(text)
+    page_key = f"page:{url}"
+    page = _cache.get(page_key, CACHE_MAX_AGE) if _cache is not None else _MISSING
+    headers = {"Accept-Encoding": LYRICS_ACCEPT_ENCODING}
+    if page is not _MISSING:
+        if page["etag"]:
+            headers["If-None-Match"] = page["etag"]
+        if page["last_modified"]:
+            headers["If-Modified-Since"] = page["last_modified"]
+
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        if response.status == 304 and page is not _MISSING:
+            _cache.set(page_key, page)  # Still valid: restart its expiry
+            return page["lyrics"]
+        collector = _LyricsCollector()
+        parser = etree.HTMLParser(target=collector, encoding=response.charset)
+        async for chunk in response.content.iter_chunked(LYRICS_CHUNK_SIZE):
+            parser.feed(chunk)
+        try:
+            lyrics = parser.close()
+        except etree.XMLSyntaxError:
+            # Raised for an empty page, in which case lxml skips the target's close().
+            lyrics = collector.close()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
 
-    return "\n".join(lyrics_lines)
+    if _cache is not None and (etag or last_modified):
+        _cache.set(page_key, {"etag": etag, "last_modified": last_modified, "lyrics": lyrics})
+    return lyrics
 
 
 def _print_metadata(song: dict) -> str:
@@ -185,96 +495,110 @@ def _sanitize_filename(name: str) -> str:
     Returns:
         str: Sanitized filename string.
     """
-    return re.sub(r'[^\w\s\-_().]', '', name).strip().replace(" ", "_")
+    return _FILENAME_RE.sub('', name).strip().replace(" ", "_")
 
 
-def _write_to_file(content: str, title: str, folder_path: str, extension: str = "txt"):
+async def _write_to_file(content: Union[bytes, str], title: str, folder_path: str, extension: str = "txt"):
     """
     Write the given content to a file named after the song title
     inside the specified folder. Creates the folder if it does not exist.
+    The blocking file I/O runs in a worker thread to keep the event loop free.
 
     Args:
-        content (str): Content to write into the file.
+        content (bytes | str): Content to write into the file; text is
+            encoded as UTF-8, bytes are written as-is.
         title (str): Title of the song used to create the filename.
         folder_path (str): Destination folder path.
         extension (str): File extension (default is 'txt').
     """
-    os.makedirs(folder_path, exist_ok=True)
     filename = _sanitize_filename(title)
     filepath = os.path.join(folder_path, f"{filename}.{extension}")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+
+    def _write() -> None:
+        os.makedirs(folder_path, exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+
+    await asyncio.to_thread(_write)
     print(f"\n[FICHIER SAUVÉ] {filepath}")
 
 
-def main() -> None:
+async def _warm_up_connections(session: aiohttp.ClientSession, urls: List[str]) -> None:
     """
-    Main entry point: parses command-line arguments, processes input URLs,
-    retrieves song metadata and/or lyrics from Genius, formats output
-    according to user options, and optionally writes output to a file.
+    Open keep-alive connections to the given Genius hosts in the background,
+    so their DNS lookup and TLS handshake overlap with the oEmbed request
+    instead of delaying the first Genius call. Failures are ignored: the
+    real requests will simply open their own connections.
     """
-    parser = argparse.ArgumentParser(description="Fetch song info and/or lyrics from Genius.")
-    src_group = parser.add_mutually_exclusive_group(required=True)
-    src_group.add_argument("-sp", "--spotify", metavar="URL", help="Spotify track URL")
-    src_group.add_argument("-sc", "--soundcloud", metavar="URL", help="SoundCloud track URL")
+    async def head(url: str) -> None:
+        async with session.head(url, allow_redirects=False):
+            pass
 
-    mode_group = parser.add_mutually_exclusive_group()
-    mode_group.add_argument("-l", "--lyrics", action="store_true", help="Return only lyrics")
-    mode_group.add_argument("-d", "--data", action="store_true", help="Return only song metadata")
-
-    parser.add_argument("-o", "--output", choices=["text", "json"], default="text",
-                        help="Output format (default: text)")
+    await asyncio.gather(*(head(url) for url in urls), return_exceptions=True)
 
-    parser.add_argument("-f", "--file", nargs="?", const=".", metavar="FOLDER",
-                        help="Save output to specified folder, or current folder if no folder given")
 
-    args = parser.parse_args()
-    token = GENIUS_ACCESS_TOKEN
+async def _process_track(session: aiohttp.ClientSession, api: aiohttp.ClientSession, source: str, url: str,
+                         args: argparse.Namespace, batch: bool = False) -> None:
+    """
+    Run the full pipeline for a single track URL: resolve its metadata,
+    find it on Genius, fetch song data and/or lyrics, then print or save
+    the formatted output.
 
-    if not token or token == "[/!\ YOUR GENIUS ACCESS TOKEN HERE /!\]":
-        sys.stderr.write("[ERROR] Please set GENIUS_ACCESS_TOKEN in the script (line 32).\n")
-        sys.exit(1)
+    In batch mode, printed text results are headed by their input URL, JSON
+    results are printed one document per line with a "source_url" key, and
+    saved files are suffixed with the Genius song id so that tracks sharing
+    a title do not overwrite each other.
 
-    try:
-        if args.spotify:
-            track, artist = _get_spotify_metadata(args.spotify)
-        elif args.soundcloud:
-            track, artist = _get_soundcloud_metadata(args.soundcloud)
-        else:
-            raise ValueError("Aucune source musicale valide n'a été fournie.")
-    except ValueError as e:
-        sys.stderr.write(f"[ERROR] {e}\n")
-        sys.exit(1)
+    Raises:
+        ValueError: If the track cannot be resolved or matched on Genius.
+    """
+    if source == "spotify":
+        track, artist = await _get_spotify_metadata(session, url)
+    elif source == "soundcloud":
+        track, artist = await _get_soundcloud_metadata(session, url)
+    else:
+        raise ValueError("Aucune source musicale valide n'a été fournie.")
 
     if not track:
-        sys.stderr.write("[ERROR] Could not parse metadata from provided link.\n")
-        sys.exit(1)
+        raise ValueError("Could not parse metadata from provided link.")
 
-    song_id = _search_genius(track, artist, token)
-    if not song_id:
-        sys.stderr.write("[ERROR] No matching song found on Genius.\n")
-        sys.exit(1)
-
-    song = _get_genius_song(song_id, token)
-    title = song.get("title", "unknown_title")
+    hit = await _search_genius(api, track, artist)
+    if not hit:
+        raise ValueError("No matching song found on Genius.")
 
+    # The lyrics page URL is already known from the search hit, so the
+    # song metadata and the lyrics can be fetched concurrently.
     need_lyrics = args.lyrics or (not args.data)
     lyrics = ""
     if need_lyrics:
-        try:
-            lyrics = _scrape_genius_lyrics(song["url"])
-        except Exception as e:
-            sys.stderr.write(f"[WARNING] Lyrics scraping failed: {e}\n")
+        song, lyrics = await asyncio.gather(
+            _get_genius_song(api, hit["id"]),
+            _scrape_genius_lyrics(session, hit["url"]),
+            return_exceptions=True,
+        )
+        if isinstance(song, BaseException):
+            raise song
+        if isinstance(lyrics, BaseException):
+            prefix = f"{url}: " if batch else ""
+            sys.stderr.write(f"[WARNING] {prefix}Lyrics scraping failed: {lyrics}\n")
+            lyrics = ""
+    else:
+        song = await _get_genius_song(api, hit["id"])
+
+    title = song.get("title", "unknown_title")
 
     if args.output == "json":
         if args.lyrics:
-            output = json.dumps({"lyrics": lyrics}, ensure_ascii=False, indent=2)
-        elif args.data:
-            output = json.dumps(song, ensure_ascii=False, indent=2)
+            document = {"lyrics": lyrics}
+        else:
+            document = song
+            if not args.data:
+                song["lyrics"] = lyrics
+        if batch and args.file is None:
+            document["source_url"] = url
+            output = orjson.dumps(document)
         else:
-            song_with_lyrics = dict(song)
-            song_with_lyrics["lyrics"] = lyrics
-            output = json.dumps(song_with_lyrics, ensure_ascii=False, indent=2)
+            output = orjson.dumps(document, option=orjson.OPT_INDENT_2)
     else:
         if args.lyrics:
             output = lyrics
@@ -285,13 +609,120 @@ def main() -> None:
 
     if args.file is not None:
         folder_path = args.file
-        _write_to_file(output, title, folder_path, extension="json" if args.output == "json" else "txt")
+        filename = f"{title}_{hit['id']}" if batch else title
+        await _write_to_file(output, filename, folder_path, extension="json" if args.output == "json" else "txt")
+    elif batch and args.output == "text":
+        print(f"==> {url} <==\n{output}\n")
     else:
-        print(output)
+        print(output.decode("utf-8") if isinstance(output, bytes) else output)
+
+
+async def _process_batch_track(session: aiohttp.ClientSession, api: aiohttp.ClientSession, source: str, url: str,
+                               args: argparse.Namespace, semaphore: asyncio.Semaphore) -> bool:
+    """
+    Process one track of a batch, bounded by the shared semaphore.
+    Errors are reported for this URL only so the rest of the batch keeps going.
+
+    Returns:
+        bool: True if the track was processed successfully.
+    """
+    async with semaphore:
+        try:
+            await _process_track(session, api, source, url, args, batch=True)
+        except ValueError as e:
+            sys.stderr.write(f"[ERROR] {url}: {e}\n")
+            return False
+        except Exception as e:
+            sys.stderr.write(f"[ERROR] {url}: {type(e).__name__}: {e}\n")
+            return False
+    return True
+
+
+async def main() -> None:
+    """
+    Main entry point: parses command-line arguments, processes input URLs,
+    retrieves song metadata and/or lyrics from Genius, formats output
+    according to user options, and optionally writes output to a file.
+    When the URL is "-", newline-delimited URLs are read from stdin and
+    processed concurrently.
+    """
+    parser = argparse.ArgumentParser(description="Fetch song info and/or lyrics from Genius.")
+    src_group = parser.add_mutually_exclusive_group(required=True)
+    src_group.add_argument("-sp", "--spotify", metavar="URL",
+                           help="Spotify track URL, or '-' to read URLs from stdin")
+    src_group.add_argument("-sc", "--soundcloud", metavar="URL",
+                           help="SoundCloud track URL, or '-' to read URLs from stdin")
+
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument("-l", "--lyrics", action="store_true", help="Return only lyrics")
+    mode_group.add_argument("-d", "--data", action="store_true", help="Return only song metadata")
+
+    parser.add_argument("-o", "--output", choices=["text", "json"], default="text",
+                        help="Output format (default: text)")
+
+    parser.add_argument("-f", "--file", nargs="?", const=".", metavar="FOLDER",
+                        help="Save output to specified folder, or current folder if no folder given")
+
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk cache of previous lookups")
+
+    args = parser.parse_args()
+    token = GENIUS_ACCESS_TOKEN
+
+    if not token or token == "[/!\ YOUR GENIUS ACCESS TOKEN HERE /!\]":
+        sys.stderr.write("[ERROR] Please set GENIUS_ACCESS_TOKEN at the top of the script.\n")
+        sys.exit(1)
+
+    global _cache
+    if not args.no_cache:
+        try:
+            _cache = _Cache(CACHE_PATH)
+        except (OSError, sqlite3.Error) as e:
+            sys.stderr.write(f"[WARNING] Cache disabled: {e}\n")
+
+    source = "spotify" if args.spotify else "soundcloud"
+    url = args.spotify or args.soundcloud
+    metadata_lookup = _get_spotify_metadata if source == "spotify" else _get_soundcloud_metadata
+    # Lyric pages are never fetched in data-only mode.
+    warm_up_urls = [GENIUS_API_BASE] if args.data else [GENIUS_API_BASE, GENIUS_WEB_BASE]
+
+    # Both sessions share one connector so every request draws from the same
+    # keep-alive pool; only the Genius API session carries the access token.
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_TRACKS, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT) as session, \
+            aiohttp.ClientSession(GENIUS_API_BASE, connector=connector, connector_owner=False,
+                                  headers={"Authorization": f"Bearer {token}"}, timeout=REQUEST_TIMEOUT) as api:
+        # When the oEmbed lookup is answered from the cache there is no request
+        # to overlap with, and the Genius lookups are most likely cached too.
+        warm_up = None
+        if url == "-" or not metadata_lookup.is_cached(url):
+            warm_up = asyncio.create_task(_warm_up_connections(session, warm_up_urls))
+        try:
+            if url != "-":
+                try:
+                    await _process_track(session, api, source, url, args)
+                except ValueError as e:
+                    sys.stderr.write(f"[ERROR] {e}\n")
+                    sys.exit(1)
+                return
+
+            urls = [line.strip() for line in sys.stdin if line.strip()]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACKS)
+            results = await asyncio.gather(
+                *(_process_batch_track(session, api, source, u, args, semaphore) for u in urls)
+            )
+        finally:
+            if warm_up is not None:
+                warm_up.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await warm_up
+
+    if not all(results):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\nCancelled by user.")